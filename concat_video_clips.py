@@ -1,6 +1,10 @@
+import collections
+import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 import shutil
+import struct
 import subprocess
 import sys
 import tempfile
@@ -12,14 +16,43 @@ from tkinter import ttk
 
 # --------- Utilities ---------
 
+# The concat-filter path opens every clip at once (one demuxer + decoder each);
+# larger mixed-fps folders fall back to the concat demuxer instead
+MAX_CONCAT_FILTER_CLIPS = 300
+
+H264_ENCODERS = ["libx264", "h264_nvenc", "h264_qsv", "h264_videotoolbox", "h264_amf"]
+_FFMPEG_CACHE = {}  # memoized tool lookups: "available" -> bool, "encoders" -> set of names
+
 def check_ffmpeg():
     """Return True if ffmpeg is available on PATH (ffprobe comes with it)."""
-    return shutil.which("ffmpeg") is not None and shutil.which("ffprobe") is not None
+    # Only a positive result is cached, so installing ffmpeg while the app is open still works
+    if not _FFMPEG_CACHE.get("available"):
+        _FFMPEG_CACHE["available"] = shutil.which("ffmpeg") is not None and shutil.which("ffprobe") is not None
+    return _FFMPEG_CACHE["available"]
+
+def get_available_encoders():
+    """Return the set of encoder names this ffmpeg build supports (probed once, then cached)."""
+    if "encoders" not in _FFMPEG_CACHE:
+        names = set()
+        try:
+            out = subprocess.run(["ffmpeg","-hide_banner","-encoders"], capture_output=True, text=True)
+            started = False
+            for line in out.stdout.splitlines():
+                # Encoder rows follow the " ------" separator: " V....D libx264   description"
+                if line.strip().startswith("-"):
+                    started = True; continue
+                parts = line.split()
+                if started and len(parts) >= 2:
+                    names.add(parts[1])
+        except Exception:
+            return names  # don't cache a failed probe
+        _FFMPEG_CACHE["encoders"] = names
+    return _FFMPEG_CACHE["encoders"]
+
+_NUM_SPLIT = re.compile(r'(\d+)')
 
 def natural_keys(text):
-    def atoi(tok):
-        return int(tok) if tok.isdigit() else tok.lower()
-    return [atoi(c) for c in re.split(r'(\d+)', text)]
+    return [int(c) if c.isdigit() else c.lower() for c in _NUM_SPLIT.split(text)]
 
 def build_concat_listfile(files):
     tmp = tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False, encoding="utf-8")
@@ -31,15 +64,184 @@ def build_concat_listfile(files):
         tmp.close()
     return tmp.name
 
-def has_audio_stream(sample_file):
+def build_filter_script(graph):
+    """Write a filter graph to a temp file for -filter_complex_script (keeps the command line short)."""
+    tmp = tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False, encoding="utf-8")
+    try:
+        tmp.write(graph)
+    finally:
+        tmp.close()
+    return tmp.name
+
+def fps_match(a, b):
+    """Frame rates equal within 0.1% (absorbs rounding between header- and ffprobe-derived rates)."""
+    return a > 0 and b > 0 and abs(a - b) <= 1e-3 * max(a, b)
+
+def clips_match(params):
+    """True when every clip has the same codec, size and frame rate (safe to concat with -c copy)."""
+    first = params[0] if params else None
+    return bool(params) and first["codec"] != "" and all(
+        (p["codec"], p["width"], p["height"]) == (first["codec"], first["width"], first["height"])
+        and fps_match(p["fps"], first["fps"])
+        for p in params
+    )
+
+def can_stream_copy(user_fps, source_fps, speed_mode):
+    """True when the output would match the source frame rate, so no re-encode is needed."""
+    return (not speed_mode) and source_fps > 0 and abs(float(user_fps) - float(source_fps)) < 0.01
+
+def _iter_mp4_boxes(f, start, end):
+    """Yield (type, payload_start, box_end) for each MP4 box between start and end."""
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        hdr = f.read(8)
+        if len(hdr) < 8: return
+        size, kind = struct.unpack(">I4s", hdr)
+        hlen = 8
+        if size == 1:  # 64-bit largesize follows the type
+            ext = f.read(8)
+            if len(ext) < 8: return
+            size = struct.unpack(">Q", ext)[0]; hlen = 16
+        elif size == 0:  # box runs to end of file
+            size = end - pos
+        if size < hlen: return
+        yield kind, pos + hlen, min(pos + size, end)
+        pos += size
+
+def read_mp4_duration(path):
+    """Duration in seconds from the moov/mvhd header, or None if it can't be read."""
     try:
-        cmd = ["ffprobe","-v","error","-select_streams","a","-show_entries","stream=codec_type","-of","csv=p=0",str(sample_file)]
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            for kind, body, end in _iter_mp4_boxes(f, 0, f.tell()):
+                if kind != b"moov": continue
+                for kind2, body2, _ in _iter_mp4_boxes(f, body, end):
+                    if kind2 != b"mvhd": continue
+                    f.seek(body2)
+                    version = f.read(1)[0]
+                    if version == 1:
+                        f.seek(body2 + 4 + 16)  # version/flags + 64-bit creation/modification times
+                        timescale, duration = struct.unpack(">IQ", f.read(12))
+                        unknown = 0xFFFFFFFFFFFFFFFF
+                    else:
+                        f.seek(body2 + 4 + 8)
+                        timescale, duration = struct.unpack(">II", f.read(8))
+                        unknown = 0xFFFFFFFF
+                    if timescale > 0 and 0 < duration < unknown:
+                        return duration / timescale
+                    return None
+    except Exception:
+        pass
+    return None
+
+def _find_mp4_box(f, start, end, *path):
+    """Descend through nested boxes by type; return (payload_start, box_end) or None."""
+    for kind in path:
+        for k, body, box_end in _iter_mp4_boxes(f, start, end):
+            if k == kind:
+                start, end = body, box_end
+                break
+        else:
+            return None
+    return start, end
+
+# MP4 sample-entry fourcc -> ffprobe codec_name, so header and ffprobe results compare equal
+_MP4_CODECS = {b"avc1": "h264", b"avc3": "h264", b"hvc1": "hevc", b"hev1": "hevc", b"mp4v": "mpeg4", b"av01": "av1"}
+
+def read_mp4_video_params(path):
+    """
+    dict(codec, width, height, fps, audio) straight from the moov headers: stsd for
+    codec and coded size, mdhd timescale / dominant stts delta for fps, hdlr for audio.
+    Returns None if there is no parsable video track.
+    """
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            moov = _find_mp4_box(f, 0, f.tell(), b"moov")
+            if moov is None: return None
+            video, audio = None, False
+            for kind, trak, trak_end in _iter_mp4_boxes(f, *moov):
+                if kind != b"trak": continue
+                hdlr = _find_mp4_box(f, trak, trak_end, b"mdia", b"hdlr")
+                if hdlr is None: continue
+                f.seek(hdlr[0] + 8)  # version/flags + pre_defined
+                handler = f.read(4)
+                if handler == b"soun":
+                    audio = True
+                if handler != b"vide" or video is not None: continue
+
+                stbl = _find_mp4_box(f, trak, trak_end, b"mdia", b"minf", b"stbl")
+                stsd = _find_mp4_box(f, *stbl, b"stsd")
+                # First sample entry: size, fourcc, 6 reserved, data_ref_index, 16 predefined, width, height
+                f.seek(stsd[0] + 8)
+                entry = f.read(36)
+                fourcc = entry[4:8]
+                w, h = struct.unpack_from(">HH", entry, 32)
+
+                mdhd = _find_mp4_box(f, trak, trak_end, b"mdia", b"mdhd")
+                f.seek(mdhd[0])
+                f.seek(mdhd[0] + (20 if f.read(1)[0] == 1 else 12))
+                (timescale,) = struct.unpack(">I", f.read(4))
+
+                # Nominal rate (like ffprobe's r_frame_rate) from the dominant sample delta,
+                # so an odd-length last frame doesn't skew it the way an average would
+                stts = _find_mp4_box(f, *stbl, b"stts")
+                f.seek(stts[0] + 4)
+                (count,) = struct.unpack(">I", f.read(4))
+                entries = f.read(8 * count)
+                per_delta = collections.Counter()
+                for i in range(len(entries) // 8):
+                    n, delta = struct.unpack_from(">II", entries, 8 * i)
+                    per_delta[delta] += n
+                if timescale <= 0 or not per_delta:
+                    return None
+                delta = per_delta.most_common(1)[0][0]
+                if delta <= 0:
+                    return None
+                video = dict(
+                    codec=_MP4_CODECS.get(fourcc, fourcc.decode("ascii", "replace").strip()),
+                    width=w, height=h, fps=timescale / delta
+                )
+            if video is None:
+                return None
+            video["audio"] = audio
+            return video
+    except Exception:
+        pass
+    return None
+
+def get_video_params(sample_file):
+    """
+    Return dict(codec, width, height, fps, audio) for a clip. Read from the MP4 headers
+    when possible; otherwise one ffprobe call (codec_name, width, height, r_frame_rate).
+    Unknown fields are empty/0.
+    """
+    params = read_mp4_video_params(sample_file)
+    if params is not None:
+        return params
+    params = dict(codec="", width=0, height=0, fps=0.0, audio=False)
+    try:
+        cmd = ["ffprobe","-v","error","-show_entries","stream=codec_type,codec_name,width,height,r_frame_rate","-of","json",str(sample_file)]
         out = subprocess.run(cmd, capture_output=True, text=True)
-        return "audio" in out.stdout.lower()
+        streams = json.loads(out.stdout)["streams"]
+        params["audio"] = any(st.get("codec_type") == "audio" for st in streams)
+        stream = next(st for st in streams if st.get("codec_type") == "video")
+        num, _, den = stream.get("r_frame_rate", "0/1").partition("/")
+        params.update(
+            codec=stream.get("codec_name", ""),
+            width=int(stream.get("width", 0)),
+            height=int(stream.get("height", 0)),
+            fps=float(num) / float(den or 1)
+        )
     except Exception:
-        return True
+        pass
+    return params
 
 def get_duration_seconds(path):
+    dur = read_mp4_duration(path)
+    if dur is not None:
+        return dur
     try:
         cmd = ["ffprobe","-v","error","-show_entries","format=duration","-of","default=noprint_wrappers=1:nokey=1",str(path)]
         out = subprocess.run(cmd, capture_output=True, text=True)
@@ -47,6 +249,14 @@ def get_duration_seconds(path):
     except Exception:
         return 0.0
 
+def probe_concurrently(func, paths):
+    """Return [func(p) for p in paths], probing files concurrently (each probe is process-startup bound)."""
+    if not paths:
+        return []
+    workers = min(32, (os.cpu_count() or 1) * 4, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, paths))
+
 def hms_from_seconds(sec):
     sec = max(0.0, float(sec))
     h = int(sec // 3600); m = int((sec % 3600) // 60); s = sec % 60
@@ -61,74 +271,177 @@ def _build_atempo_chain(factor):
         steps.append(2.0); factor /= 2.0
     if abs(factor - 1.0) > 1e-6:
         steps.append(factor)
+    # Each atempo stage must stay within [0.5, 2.0]; outside that some builds drop samples
+    assert all(0.5 <= s <= 2.0 for s in steps), steps
     return steps
 
+def _video_encoder_args(encoder, preset):
+    """ffmpeg video codec flags for the chosen H.264 encoder (roughly CRF 23 quality)."""
+    if encoder == "h264_nvenc":
+        return ["-c:v","h264_nvenc","-preset","p4","-rc","vbr","-cq","23","-b:v","0"]  # -b:v 0: let -cq drive quality
+    if encoder == "h264_qsv":
+        return ["-c:v","h264_qsv","-preset","veryfast","-global_quality","23"]
+    if encoder == "h264_videotoolbox":
+        return ["-c:v","h264_videotoolbox","-q:v","55"]
+    if encoder == "h264_amf":
+        return ["-c:v","h264_amf","-quality","speed","-rc","cqp","-qp_i","23","-qp_p","23"]
+    return ["-c:v","libx264","-preset",preset,"-crf","23"]
+
+def _concat_filter_graph(clips, speed=1.0, with_audio=False, out_fps=None):
+    """
+    -filter_complex graph that retimes every input ([i:v]/[i:a]) and joins them with
+    the concat filter, which copes with clips of differing frame rates. clips are
+    get_video_params() dicts plus "duration". Every segment is scaled to the first
+    clip's size, and clips without audio get matching silence, since concat needs
+    identical segment layouts. Outputs [outv] (and [outa]); out_fps adds a final fps
+    filter for constant-rate output.
+    """
+    if abs(speed - 1.0) < 1e-6:
+        vf = "setpts=PTS-STARTPTS"
+    else:
+        vf = f"setpts=(PTS-STARTPTS)/{speed:g}"
+    w, h = clips[0]["width"], clips[0]["height"]
+    if w > 0 and h > 0:
+        vf = f"scale={w}:{h},setsar=1," + vf
+    aformat = "aformat=sample_rates=48000:channel_layouts=stereo"
+    af = ",".join([aformat, "asetpts=PTS-STARTPTS"] + [f"atempo={s:.6g}" for s in _build_atempo_chain(speed)])
+    parts, labels = [], []
+    for i, clip in enumerate(clips):
+        parts.append(f"[{i}:v]{vf}[v{i}]"); labels.append(f"[v{i}]")
+        if with_audio:
+            if clip["audio"]:
+                parts.append(f"[{i}:a]{af}[a{i}]")
+            else:
+                silence = max(0.0, clip.get("duration", 0.0)) / speed
+                parts.append(f"anullsrc=channel_layout=stereo:sample_rate=48000,atrim=duration={silence:.6f},{aformat}[a{i}]")
+            labels.append(f"[a{i}]")
+    n = len(clips)
+    vout = "[outv]" if out_fps is None else "[vcat]"
+    parts.append("".join(labels) + f"concat=n={n}:v=1:a={int(with_audio)}" + vout + ("[outa]" if with_audio else ""))
+    if out_fps is not None:
+        parts.append(f"[vcat]fps={out_fps:g}[outv]")
+    return ";".join(parts)
+
+def _iter_byte_lines(stream, chunk_size=4096):
+    """Yield raw lines (without the newline) from a binary pipe, reading it in chunks."""
+    buf = bytearray()
+    while True:
+        chunk = stream.read1(chunk_size)
+        if not chunk: break
+        buf += chunk
+        start = 0
+        while True:
+            nl = buf.find(b"\n", start)
+            if nl < 0: break
+            yield bytes(buf[start:nl])
+            start = nl + 1
+        del buf[:start]
+    if buf:
+        yield bytes(buf)
+
 def run_ffmpeg_concat(
     listfile, user_fps, out_path,
     log_callback=None, progress_callback=None,
     speed_mode=True, base_output_fps=60,
-    keep_audio=True, audio_present=True
+    keep_audio=True, audio_present=True,
+    preset="faster", stream_copy=False, source_fps=0.0,
+    encoder="libx264", files=None, clip_params=None, faststart=False
 ):
     """
     Reads -progress from stdout and calls progress_callback(seconds_done).
     Runs in the background thread; callbacks should be thread-safe.
+    With stream_copy=True and a matching source_fps, clips are remuxed without re-encoding.
+    If files is given (clips with mixed frame rates), each clip becomes its own input
+    joined by the concat filter instead of the listfile/concat-demuxer path; clip_params
+    holds the matching get_video_params() dicts (plus "duration") for each file.
+    faststart=True writes a classic MP4 with moov moved to the front (a second pass over
+    the whole file); otherwise a fragmented MP4 is written, streamable with no rewrite.
     """
-    common = [
-        "ffmpeg","-hide_banner","-y",
-        "-f","concat","-safe","0","-i",listfile,
-        "-pix_fmt","yuv420p","-c:v","libx264","-preset","slow","-crf","22",
-        "-movflags","+faststart","-progress","pipe:1","-nostats"
-    ]
-
-    if speed_mode:
+    nthreads = str(os.cpu_count() or 1)
+    head = ["ffmpeg","-hide_banner","-y"]
+    demux = ["-f","concat","-safe","0","-i",listfile]
+    threads = ["-filter_threads",nthreads,"-filter_complex_threads",nthreads]
+    encode = ["-threads","0","-pix_fmt","yuv420p", *_video_encoder_args(encoder, preset)]
+    movflags = "+faststart" if faststart else "+frag_keyframe+empty_moov+default_base_moof"
+    tail = ["-movflags",movflags,"-progress","pipe:1","-nostats"]
+    common = head + threads + demux + encode + tail
+    script = None
+
+    if files:
+        with_audio = keep_audio and audio_present
+        speed = float(base_output_fps)/float(user_fps) if speed_mode else 1.0
+        graph = _concat_filter_graph(clip_params, speed, with_audio, None if speed_mode else user_fps)
+        # The graph grows with the clip count; from a file it can't overflow the
+        # command-line limit (32,767 chars on Windows)
+        script = build_filter_script(graph)
+        cmd = head + threads + [arg for f in files for arg in ("-i", str(f))]
+        cmd += ["-filter_complex_script", script, "-map", "[outv]", "-r", f"{base_output_fps if speed_mode else user_fps:g}"]
+        if with_audio:
+            cmd += ["-map", "[outa]", "-c:a", "aac", "-b:a", "192k"]
+        else:
+            cmd += ["-an"]
+        cmd += encode + tail + [out_path]
+    elif stream_copy and can_stream_copy(user_fps, source_fps, speed_mode):
+        cmd = head + demux
+        if keep_audio and audio_present:
+            cmd += ["-c","copy"]
+        else:
+            cmd += ["-c:v","copy","-an"]
+        cmd += tail + [out_path]
+    elif speed_mode:
         speed = float(base_output_fps)/float(user_fps)
-        vfilter = f"setpts=PTS/{speed:g}"
-        cmd = common + ["-vf", vfilter, "-r", f"{base_output_fps}"]
+        # Complex graph (rather than -vf) so -filter_complex_threads applies
+        vfilter = f"[0:v]setpts=PTS/{speed:g}[v]"
+        cmd = common + ["-filter_complex", vfilter, "-map", "[v]", "-r", f"{base_output_fps}"]
         if keep_audio and audio_present:
+            cmd += ["-map", "0:a?"]
             steps = _build_atempo_chain(speed)
             if steps:
-                cmd += ["-filter:a", ",".join(f"atempo={s:.6g}" for s in steps), "-c:a", "aac", "-b:a", "192k"]
+                cmd += ["-af", ",".join(f"atempo={s:.6g}" for s in steps), "-c:a", "aac", "-b:a", "192k"]
             else:
-                cmd += ["-c:a", "aac", "-b:a", "192k"]
+                # Speed 1×: audio is untouched, so copy it instead of re-encoding
+                cmd += ["-c:a", "copy"]
         else:
             cmd += ["-an"]
         cmd += [out_path]
     else:
         cmd = common + ["-vf", f"fps={user_fps}", "-r", f"{user_fps}"]
         if keep_audio and audio_present:
-            cmd += ["-c:a", "aac", "-b:a", "192k"]
+            # No tempo change here, so the audio is copied instead of re-encoded
+            cmd += ["-c:a", "copy"]
         else:
             cmd += ["-an"]
         cmd += [out_path]
 
-    proc = subprocess.Popen(
-        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-        universal_newlines=True, bufsize=1, encoding="utf-8", errors="replace"
-    )
-
-    for raw in proc.stdout:
-        line = (raw or "").strip()
-        if not line: continue
-        if line.startswith("out_time_ms="):
-            try:
-                us = int(line.split("=",1)[1].strip())
-                secs = us/1_000_000.0
-                if progress_callback: progress_callback(secs)
-            except Exception: pass
-            continue
-        if line.startswith("out_time="):
-            try:
-                t = line.split("=",1)[1].strip()
-                hh,mm,ss = t.split(":")
-                secs = int(hh)*3600 + int(mm)*60 + float(ss)
-                if progress_callback: progress_callback(secs)
+    try:
+        # Binary pipe: progress keys are parsed straight from bytes; only log lines get decoded
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=65536)
+
+        for raw in _iter_byte_lines(proc.stdout):
+            line = raw.strip()
+            if not line: continue
+            if line.startswith(b"out_time_ms="):
+                try:
+                    secs = int(line[12:])/1_000_000.0
+                    if progress_callback: progress_callback(secs)
+                except Exception: pass
+                continue
+            if line.startswith(b"out_time="):
+                try:
+                    hh,mm,ss = line[9:].split(b":")
+                    secs = int(hh)*3600 + int(mm)*60 + float(ss)
+                    if progress_callback: progress_callback(secs)
+                except Exception: pass
+                continue
+            if line.startswith(b"progress="):
+                continue
+            if log_callback: log_callback(line.decode("utf-8", errors="replace"))
+
+        return proc.wait()
+    finally:
+        if script:
+            try: os.remove(script)
             except Exception: pass
-            continue
-        if line.startswith("progress="):
-            continue
-        if log_callback: log_callback(line)
-
-    return proc.wait()
 
 # --------- GUI ---------
 
@@ -136,15 +449,23 @@ class App(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("Dashcam MP4 Concatenator")
-        self.geometry("820x640")
+        self.geometry("820x720")
 
         self.folder_var = tk.StringVar()
         self.outfile_var = tk.StringVar()
         self.fps_var = tk.StringVar(value="60")
         self.speed_mode_var = tk.BooleanVar(value=True)
         self.keep_audio_var = tk.BooleanVar(value=True)
+        self.preset_var = tk.StringVar(value="faster")
+        self.stream_copy_var = tk.BooleanVar(value=True)
+        self.encoder_var = tk.StringVar(value="libx264")
+        self.faststart_var = tk.BooleanVar(value=False)
         self.base_out_fps = 60
         self.total_duration = 0.0
+        # ffmpeg output is buffered here by the worker and flushed to the Text widget in batches
+        self._log_buf = collections.deque()
+        self._log_lock = threading.Lock()
+        self._log_flush_scheduled = False
 
         row = 0
         tk.Label(self, text="Folder with MP4 clips:").grid(row=row, column=0, sticky="w", padx=10, pady=(12,4))
@@ -161,7 +482,23 @@ class App(tk.Tk):
         row += 1
         tk.Checkbutton(self, text="Keep output at 60 fps and adjust speed (fast-forward/slow-mo)", variable=self.speed_mode_var).grid(row=row, column=1, sticky="w", padx=6, pady=(0,6))
         row += 1
-        tk.Checkbutton(self, text="Keep audio", variable=self.keep_audio_var).grid(row=row, column=1, sticky="w", padx=6, pady=(0,10))
+        tk.Checkbutton(self, text="Keep audio", variable=self.keep_audio_var).grid(row=row, column=1, sticky="w", padx=6, pady=(0,6))
+        row += 1
+        tk.Checkbutton(self, text="Stream copy when possible (no re-encode if FPS matches the clips and speed mode is off)", variable=self.stream_copy_var).grid(row=row, column=1, sticky="w", padx=6, pady=(0,6))
+        row += 1
+        tk.Checkbutton(self, text="Optimize for streaming (slower finalize: rewrites the file to move the index to the front)", variable=self.faststart_var).grid(row=row, column=1, sticky="w", padx=6, pady=(0,10))
+        row += 1
+        tk.Label(self, text="x264 preset:").grid(row=row, column=0, sticky="w", padx=10, pady=4)
+        ttk.Combobox(
+            self, textvariable=self.preset_var, state="readonly", width=12,
+            values=["ultrafast","superfast","veryfast","faster","fast","medium","slow"]
+        ).grid(row=row, column=1, sticky="w", padx=6, pady=4)
+        tk.Label(self, text="Faster presets encode quicker; slower ones give slightly smaller files.").grid(row=row, column=1, sticky="w", padx=120, pady=4)
+        row += 1
+        tk.Label(self, text="Encoder:").grid(row=row, column=0, sticky="w", padx=10, pady=4)
+        self.encoder_combo = ttk.Combobox(self, textvariable=self.encoder_var, values=["libx264"], state="readonly", width=18)
+        self.encoder_combo.grid(row=row, column=1, sticky="w", padx=6, pady=4)
+        tk.Label(self, text="Hardware encoders (NVENC/QSV/VideoToolbox/AMF) are much faster.").grid(row=row, column=1, sticky="w", padx=160, pady=4)
         row += 1
         self.start_btn = tk.Button(self, text="Concatenate", command=self.start, width=16)
         self.start_btn.grid(row=row, column=0, padx=10, pady=10, sticky="w")
@@ -184,7 +521,10 @@ class App(tk.Tk):
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(row, weight=1)
 
-        if not check_ffmpeg():
+        if check_ffmpeg():
+            available = get_available_encoders()
+            self.encoder_combo["values"] = [e for e in H264_ENCODERS if e == "libx264" or e in available]
+        else:
             messagebox.showwarning(
                 "ffmpeg/ffprobe not found",
                 "ffmpeg (and ffprobe) are not on your PATH.\n\nInstall ffmpeg and try again.\n"
@@ -210,9 +550,35 @@ class App(tk.Tk):
             self.outfile_var.set(path)
 
     def append_log(self, text):
+        self._drain_log()  # keep ordering with lines still buffered from the worker
         self.log.insert("end", text + "\n")
         self.log.see("end")
 
+    def queue_log(self, text):
+        """Thread-safe: buffer a log line; it is written on the Tk thread within ~100 ms."""
+        with self._log_lock:
+            self._log_buf.append(text)
+            if self._log_flush_scheduled:
+                return
+            self._log_flush_scheduled = True
+        self.after(100, self._flush_log)
+
+    def _drain_log(self, limit=None):
+        with self._log_lock:
+            n = len(self._log_buf) if limit is None else min(limit, len(self._log_buf))
+            batch = [self._log_buf.popleft() for _ in range(n)]
+        if batch:
+            self.log.insert("end", "\n".join(batch) + "\n")
+            self.log.see("end")
+
+    def _flush_log(self):
+        self._drain_log(limit=500)
+        with self._log_lock:
+            more = bool(self._log_buf)
+            self._log_flush_scheduled = more
+        if more:
+            self.after(100, self._flush_log)
+
     def _set_progress_total(self, seconds_total):
         self.total_duration = max(0.0, float(seconds_total))
         if self.total_duration > 0:
@@ -235,6 +601,10 @@ class App(tk.Tk):
         fps_str = self.fps_var.get().strip() or "60"
         speed_mode = self.speed_mode_var.get()
         keep_audio = self.keep_audio_var.get()
+        preset = self.preset_var.get() or "faster"
+        stream_copy = self.stream_copy_var.get()
+        encoder = self.encoder_var.get() or "libx264"
+        faststart = self.faststart_var.get()
 
         if not folder:
             messagebox.showerror("Missing folder","Please select the folder containing your MP4 clips."); return
@@ -248,17 +618,19 @@ class App(tk.Tk):
             messagebox.showerror("Invalid FPS","Please enter a positive number (e.g., 60 or 20)."); return
         if not check_ffmpeg():
             messagebox.showerror("ffmpeg not found","ffmpeg/ffprobe are not on your PATH. Please install and try again."); return
+        if encoder != "libx264" and encoder not in get_available_encoders():
+            messagebox.showerror("Encoder unavailable",f"This ffmpeg build does not include {encoder}. Pick another encoder."); return
 
-        files = sorted(
-            [str(p) for p in Path(folder).iterdir() if p.is_file() and p.suffix.lower()==".mp4"],
-            key=lambda p: natural_keys(Path(p).name)
-        )
+        with os.scandir(folder) as it:
+            files = [e.path for e in it if e.is_file() and e.name.lower().endswith(".mp4")]
+        files.sort(key=lambda p: natural_keys(os.path.basename(p)))
         if not files:
             messagebox.showerror("No MP4 files","No .mp4/.MP4 files found in the selected folder."); return
 
         # Total duration for progress (adjust for speed mode)
         self.append_log("Scanning durations for progress…")
-        total_sec = sum(get_duration_seconds(f) for f in files)
+        durations = probe_concurrently(get_duration_seconds, files)
+        total_sec = sum(durations)
         if speed_mode:
             speed = self.base_out_fps / user_fps
             effective_total = total_sec / speed if speed > 0 else total_sec
@@ -266,7 +638,16 @@ class App(tk.Tk):
             effective_total = total_sec
         self._set_progress_total(effective_total)
 
-        audio_present = has_audio_stream(files[0])
+        self.append_log("Checking clip codecs and frame rates…")
+        params = probe_concurrently(get_video_params, files)
+        source_fps = params[0]["fps"]
+        rates = [p["fps"] for p in params if p["fps"] > 0]
+        mixed_fps = any(not fps_match(r, rates[0]) for r in rates)
+        use_concat_filter = mixed_fps and len(files) <= MAX_CONCAT_FILTER_CLIPS
+        # The concat filter fills silent clips itself; the demuxer path follows the first clip
+        audio_present = any(p["audio"] for p in params) if use_concat_filter else params[0]["audio"]
+        # -c copy needs identical streams; a codec/size change mid-folder would give a broken file
+        copying = stream_copy and clips_match(params) and can_stream_copy(user_fps, source_fps, speed_mode)
 
         self.append_log(f"Found {len(files)} MP4 files.")
         self.append_log("Creating ffmpeg concat list…")
@@ -281,8 +662,20 @@ class App(tk.Tk):
                 self.append_log(f"Speed mode ON: fast-forward by {(self.base_out_fps/user_fps):.3g}×, output {self.base_out_fps} fps.")
             else:
                 self.append_log(f"Speed mode ON: slow-motion by {(user_fps/self.base_out_fps):.3g}×, output {self.base_out_fps} fps.")
+        elif copying:
+            self.append_log(f"Stream copy mode: source is already {source_fps:g} fps, no re-encode.")
+        elif stream_copy and can_stream_copy(user_fps, source_fps, speed_mode):
+            self.append_log("Stream copy skipped: clips differ in codec, size or frame rate. Re-encoding instead.")
         else:
             self.append_log(f"Re-encode mode: output frame rate = {user_fps:g} fps.")
+        if not copying:
+            self.append_log(f"Encoder: {encoder}" + (f" (preset {preset})" if encoder == "libx264" else ""))
+        if use_concat_filter:
+            self.append_log(f"Clips have mixed frame rates: joining them with the concat filter "
+                            f"(ffmpeg opens all {len(files)} clips at once, one decoder each).")
+        elif mixed_fps:
+            self.append_log(f"Clips have mixed frame rates, but {len(files)} clips is too many to open at once "
+                            f"(limit {MAX_CONCAT_FILTER_CLIPS}); using the concat demuxer.")
         self.append_log(f"Audio: {'kept' if keep_audio and audio_present else 'disabled'}")
         self.append_log(f"Output: {outfile}")
         self.append_log("Running ffmpeg…")
@@ -310,13 +703,20 @@ class App(tk.Tk):
                     listfile=listfile,
                     user_fps=user_fps,
                     out_path=outfile,
-                    # IMPORTANT: marshal callbacks to Tk thread
-                    log_callback=lambda line: self.after(0, self.append_log, line),
+                    # IMPORTANT: marshal callbacks to Tk thread (log lines are batched)
+                    log_callback=self.queue_log,
                     progress_callback=lambda s: self.after(0, self._on_progress_seconds, s),
                     speed_mode=speed_mode,
                     base_output_fps=self.base_out_fps,
                     keep_audio=keep_audio,
-                    audio_present=audio_present
+                    audio_present=audio_present,
+                    preset=preset,
+                    stream_copy=copying,
+                    source_fps=source_fps,
+                    encoder=encoder,
+                    files=files if use_concat_filter else None,
+                    clip_params=[dict(p, duration=d) for p, d in zip(params, durations)],
+                    faststart=faststart
                 )
             except Exception as e:
                 rc = 1
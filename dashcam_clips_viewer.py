@@ -1,5 +1,8 @@
 import os
+import queue
 import re
+import struct
+import threading
 from pathlib import Path
 import tkinter as tk
 from tkinter import filedialog, messagebox
@@ -7,15 +10,166 @@ from tkinter import ttk
 
 # 3rd-party
 import cv2
+import numpy as np
 from PIL import Image, ImageTk
 
+try:  # optional: hardware-accelerated decode
+    import av
+except ImportError:
+    av = None
+
 # ---------- Helpers ----------
 
+_NUM_SPLIT = re.compile(r'(\d+)')
+
 def natural_keys(text):
     """Natural sort so file2 < file10."""
-    def atoi(tok):
-        return int(tok) if tok.isdigit() else tok.lower()
-    return [atoi(c) for c in re.split(r'(\d+)', text)]
+    return [int(c) if c.isdigit() else c.lower() for c in _NUM_SPLIT.split(text)]
+
+def _iter_mp4_boxes(f, start, end):
+    """Yield (type, payload_start, box_end) for each MP4 box between start and end."""
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        hdr = f.read(8)
+        if len(hdr) < 8: return
+        size, kind = struct.unpack(">I4s", hdr)
+        hlen = 8
+        if size == 1:  # 64-bit largesize follows the type
+            ext = f.read(8)
+            if len(ext) < 8: return
+            size = struct.unpack(">Q", ext)[0]; hlen = 16
+        elif size == 0:  # box runs to end of file
+            size = end - pos
+        if size < hlen: return
+        yield kind, pos + hlen, min(pos + size, end)
+        pos += size
+
+def _find_mp4_box(f, start, end, *path):
+    """Descend through nested boxes by type; return (payload_start, box_end) or None."""
+    for kind in path:
+        for k, body, box_end in _iter_mp4_boxes(f, start, end):
+            if k == kind:
+                start, end = body, box_end
+                break
+        else:
+            return None
+    return start, end
+
+def probe_mp4_video(path):
+    """
+    Read (fps, nframes, width, height) of the first video track straight from the
+    MP4 headers (tkhd/mdhd/stts), without opening a decoder. Returns None on failure.
+    """
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            moov = _find_mp4_box(f, 0, f.tell(), b"moov")
+            if moov is None: return None
+            for kind, trak, trak_end in _iter_mp4_boxes(f, *moov):
+                if kind != b"trak": continue
+                hdlr = _find_mp4_box(f, trak, trak_end, b"mdia", b"hdlr")
+                if hdlr is None: continue
+                f.seek(hdlr[0] + 8)  # version/flags + pre_defined
+                if f.read(4) != b"vide": continue
+
+                # tkhd ends with 16.16 fixed-point width and height
+                tkhd = _find_mp4_box(f, trak, trak_end, b"tkhd")
+                f.seek(tkhd[1] - 8)
+                w, h = struct.unpack(">II", f.read(8))
+
+                mdhd = _find_mp4_box(f, trak, trak_end, b"mdia", b"mdhd")
+                f.seek(mdhd[0])
+                if f.read(1)[0] == 1:
+                    f.seek(mdhd[0] + 20)
+                    timescale, duration = struct.unpack(">IQ", f.read(12))
+                else:
+                    f.seek(mdhd[0] + 12)
+                    timescale, duration = struct.unpack(">II", f.read(8))
+
+                stts = _find_mp4_box(f, trak, trak_end, b"mdia", b"minf", b"stbl", b"stts")
+                f.seek(stts[0] + 4)
+                (count,) = struct.unpack(">I", f.read(4))
+                entries = f.read(8 * count)
+                nframes = sum(struct.unpack_from(">I", entries, 8 * i)[0] for i in range(len(entries) // 8))
+
+                if timescale <= 0 or duration <= 0 or nframes <= 0:
+                    return None
+                return nframes * timescale / duration, nframes, w >> 16, h >> 16
+    except Exception:
+        pass
+    return None
+
+def probe_video(path):
+    """(fps, nframes, width, height) via the MP4 headers, falling back to OpenCV."""
+    meta = probe_mp4_video(path)
+    if meta is not None:
+        return meta
+    cap = cv2.VideoCapture(str(path))
+    if not cap.isOpened():
+        cap.release()
+        return None
+    fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+    nframes = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH) or 0)
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT) or 0)
+    cap.release()
+    return fps, nframes, width, height
+
+def find_hw_device():
+    """
+    Name of the first hardware decode device PyAV can use here, or None (no PyAV,
+    PyAV older than 14 without av.codec.hwaccel, or no supported device).
+    """
+    if av is None:
+        return None
+    try:
+        from av.codec.hwaccel import hwdevices_available
+        available = set(hwdevices_available())
+    except Exception:
+        return None
+    for dev in ("videotoolbox", "cuda", "d3d11va", "qsv", "vaapi", "dxva2"):
+        if dev in available:
+            return dev
+    return None
+
+def _iter_av_frames(path, local, fps, device):
+    """Yield BGR frames from local frame onward, decoded by PyAV on a hardware device."""
+    from av.codec.hwaccel import HWAccel
+    hwaccel = HWAccel(device_type=device, allow_software_fallback=True)
+    with av.open(path, hwaccel=hwaccel) as container:
+        stream = container.streams.video[0]
+        min_pts = None
+        if local > 0 and stream.time_base:
+            # Half a frame of slack so rounding never skips the target frame
+            min_pts = (stream.start_time or 0) + int((local - 0.5) / fps / stream.time_base)
+            container.seek(max(0, min_pts), stream=stream)  # lands on the keyframe at or before
+        for frame in container.decode(stream):
+            if min_pts is not None and frame.pts is not None and frame.pts < min_pts:
+                continue
+            yield frame.to_ndarray(format="bgr24")
+
+def iter_clip_frames(path, local=0, fps=30.0, hw_device=None):
+    """Yield BGR frames of one clip from local frame onward (PyAV on hw_device if given, else OpenCV)."""
+    if hw_device is not None:
+        try:
+            for frame in _iter_av_frames(path, local, fps, hw_device):
+                yield frame
+                local += 1
+            return
+        except Exception:
+            pass  # fall back to OpenCV from where we got to
+    cap = cv2.VideoCapture(path)
+    try:
+        if local > 0:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, float(local))
+        while True:
+            ok, frame = cap.read()
+            if not ok:
+                return
+            yield frame
+    finally:
+        cap.release()
 
 def clamp(val, lo, hi):
     return max(lo, min(hi, val))
@@ -28,16 +182,30 @@ class FolderVideoPlayer(tk.Tk):
         self.title("Folder Video Player (Mini)")
 
         # --- state ---
-        self.files = []                 # list of dicts per clip
+        # per-clip index, one parallel array per field
+        self.paths = []                                 # str
+        self.fps = np.zeros(0, dtype=np.float32)
+        self.frames = np.zeros(0, dtype=np.int64)
+        self.start_frame = np.zeros(0, dtype=np.int64)  # sorted; searched per frame
+        self.start_time = np.zeros(0, dtype=np.float64)
         self.total_frames = 0
         self.total_seconds = 0.0
-        self.cap = None                 # current cv2.VideoCapture
+        self.cap = None                 # current cv2.VideoCapture (seeks / still frames)
+        self._frame_q = None            # (gframe, bgr) from the decode thread; None item = end
+        self._reader_stop = None        # threading.Event for the current decode thread
         self.cur_file_idx = -1
+        self._expected_local_frame = 0  # local frame self.cap will return on its next read
         self.cur_global_frame = 0
         self.playing = False
         self.seeking = False            # when user drags the slider
         self.max_display_width = 960    # simple fit; adjust as you like
+        self.max_grab_ahead = 30        # forward gaps up to this many frames are grabbed, not seeked
         self.loop_var = tk.BooleanVar(value=True)
+        self.hw_decode_var = tk.BooleanVar(value=False)
+        self.hw_device = find_hw_device()  # probed once; None disables hardware decode
+        self._rgb_buf = None            # reused cvtColor output
+        self._resize_buf = None         # reused cv2.resize output
+        self._tk_img = None             # reused PhotoImage (recreated only on size change)
 
         # playback speed
         self.play_speed = 1.0
@@ -80,6 +248,11 @@ class FolderVideoPlayer(tk.Tk):
         ttk.Button(ctrl, text="+1 ⟩⟩", command=lambda: self.step(+1), width=6).pack(side="left", padx=2)
 
         ttk.Checkbutton(ctrl, text="Loop", variable=self.loop_var).pack(side="left", padx=10)
+        ttk.Checkbutton(
+            ctrl, text=f"Hardware decode ({self.hw_device or 'unavailable'})", variable=self.hw_decode_var,
+            command=self._on_hw_decode_toggle,
+            state="normal" if self.hw_device is not None else "disabled"  # needs PyAV 14+ and a device
+        ).pack(side="left", padx=(0, 10))
 
         # Speed selector
         sp = ttk.Frame(ctrl)
@@ -114,6 +287,9 @@ class FolderVideoPlayer(tk.Tk):
 
         # Footer
         self.status_var = tk.StringVar(value="")
+        if self.hw_device is None:
+            reason = "PyAV is not installed" if av is None else "PyAV 14+ with a supported GPU device is required"
+            self.status_var.set(f"Hardware decode unavailable: {reason}.")
         ttk.Label(self, textvariable=self.status_var).pack(fill="x", padx=8, pady=(0,6))
 
     # ---------- Playback speed ----------
@@ -149,49 +325,42 @@ class FolderVideoPlayer(tk.Tk):
         self._load_folder(Path(folder))
 
     def _load_folder(self, folder: Path):
-        # Close previous capture
+        # Stop decoding the previous folder, close previous capture
+        self._stop_reader()
         if self.cap is not None:
             self.cap.release()
             self.cap = None
 
         # Find .mp4 / .MP4
-        paths = [p for p in folder.iterdir() if p.is_file() and p.suffix.lower() == ".mp4"]
+        with os.scandir(folder) as it:
+            paths = [e.path for e in it if e.is_file() and e.name.lower().endswith(".mp4")]
         if not paths:
             messagebox.showerror("No videos", "No .mp4/.MP4 files found in that folder.")
             return
 
-        paths.sort(key=lambda p: natural_keys(p.name))
+        paths.sort(key=lambda p: natural_keys(os.path.basename(p)))
 
         # Build metadata index
-        files = []
+        clip_paths, clip_fps, clip_frames, start_frames, start_times = [], [], [], [], []
         total_frames = 0
         total_secs = 0.0
         start_frame = 0
         start_time = 0.0
 
         for p in paths:
-            cap = cv2.VideoCapture(str(p))
-            if not cap.isOpened():
-                cap.release()
+            meta = probe_video(p)
+            if meta is None:
                 continue
-            fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+            fps, nframes, _width, _height = meta
             if fps <= 1e-3:
                 fps = 30.0  # fallback
-            nframes = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
-            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH) or 0)
-            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT) or 0)
-            cap.release()
 
             dur = (nframes / fps) if nframes > 0 else 0.0
-            files.append(dict(
-                path=str(p),
-                fps=fps,
-                frames=nframes,
-                width=width,
-                height=height,
-                start_frame=start_frame,
-                start_time=start_time
-            ))
+            clip_paths.append(p)
+            clip_fps.append(fps)
+            clip_frames.append(nframes)
+            start_frames.append(start_frame)
+            start_times.append(start_time)
             start_frame += nframes
             start_time += dur
             total_frames += nframes
@@ -201,21 +370,26 @@ class FolderVideoPlayer(tk.Tk):
             messagebox.showerror("No frames", "Could not read frames from any file.")
             return
 
-        self.files = files
+        self.paths = clip_paths
+        self.fps = np.asarray(clip_fps, dtype=np.float32)
+        self.frames = np.asarray(clip_frames, dtype=np.int64)
+        self.start_frame = np.asarray(start_frames, dtype=np.int64)
+        self.start_time = np.asarray(start_times, dtype=np.float64)
         self.total_frames = total_frames
         self.total_seconds = total_secs
 
         # Reset playhead to start
         self.cur_file_idx = -1
         self.cur_global_frame = 0
-        self._open_capture_for_global_frame(0)
         self._display_current_frame()  # show first frame
+        if self.playing:
+            self._start_reader(1)  # frame 0 is already on screen
 
         # Configure slider
         self.slider.config(from_=0, to=max(0, self.total_frames - 1))
         self.slider.set(0)
 
-        self.info_var.set(f"{len(self.files)} clips | {self.total_frames} frames | {self._fmt_time(self.total_seconds)} total")
+        self.info_var.set(f"{len(self.paths)} clips | {self.total_frames} frames | {self._fmt_time(self.total_seconds)} total")
         self.status_var.set(self._status_text())
 
     # ---------- Mapping & capture ----------
@@ -223,91 +397,153 @@ class FolderVideoPlayer(tk.Tk):
     def _global_to_file_local(self, gframe: int):
         """Return (file_idx, local_frame) for a global frame index."""
         gframe = clamp(gframe, 0, max(0, self.total_frames - 1))
-        # Binary search would be faster; linear is fine for dozens/hundreds of clips
-        for i, f in enumerate(self.files):
-            start = f["start_frame"]
-            end = start + f["frames"]  # exclusive
-            if gframe < end:
-                return i, gframe - start
-        # Fallback to last frame
-        last = len(self.files) - 1
-        return last, max(0, self.files[last]["frames"] - 1)
+        # Last clip starting at or before gframe (side="right" skips empty clips sharing a start)
+        idx = max(0, int(np.searchsorted(self.start_frame, gframe, side="right")) - 1)
+        return idx, int(gframe - self.start_frame[idx])
 
     def _open_capture_for_file(self, idx: int):
         if idx == self.cur_file_idx:
             return
         if self.cap is not None:
             self.cap.release()
-        self.cap = cv2.VideoCapture(self.files[idx]["path"])
+        self.cap = cv2.VideoCapture(self.paths[idx])
         self.cur_file_idx = idx
+        self._expected_local_frame = 0
 
     def _open_capture_for_global_frame(self, gframe: int):
         idx, local = self._global_to_file_local(gframe)
         self._open_capture_for_file(idx)
-        self.cap.set(cv2.CAP_PROP_POS_FRAMES, float(local))
+        # Only seek when the capture isn't already there (a POS_FRAMES set may flush the decoder)
+        gap = local - self._expected_local_frame
+        if 0 < gap <= self.max_grab_ahead and self._expected_local_frame >= 0:
+            # Short hop forward: grab() decodes without retrieving/converting, cheaper than a seek
+            while gap > 0 and self.cap.grab():
+                gap -= 1
+        if gap != 0:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, float(local))
+        self._expected_local_frame = local
 
     # ---------- Playback core ----------
 
     def toggle_play(self):
         self.playing = not self.playing
         self.play_btn.config(text="Pause" if self.playing else "Play")
+        if self.playing and self.paths:
+            self._start_reader(self.cur_global_frame + 1)  # cur_global_frame is on screen
+        else:
+            self._stop_reader()
 
     def step(self, delta: int):
-        if not self.files:
+        if not self.paths:
             return
         self.playing = False
         self.play_btn.config(text="Play")
+        self._stop_reader()
         new_frame = clamp(self.cur_global_frame + delta, 0, self.total_frames - 1)
         self.seek_to(new_frame)
 
     def seek_to(self, gframe: int):
-        if not self.files:
+        if not self.paths:
             return
         self.cur_global_frame = clamp(gframe, 0, self.total_frames - 1)
-        self._open_capture_for_global_frame(self.cur_global_frame)
         self._display_current_frame()
+        if self.playing:
+            # The still frame is already on screen; decode from the one after it
+            self._start_reader(self.cur_global_frame + 1)
         if not self.seeking:
             self.slider.set(self.cur_global_frame)
         self.status_var.set(self._status_text())
 
+    # ---------- Decode thread ----------
+
+    def _start_reader(self, gframe: int):
+        """(Re)start the background decoder at a global frame; any queued frames are dropped."""
+        self._stop_reader()
+        if gframe >= self.total_frames:
+            idx, local = len(self.paths), 0  # past the end: reader just signals the end
+        else:
+            idx, local = self._global_to_file_local(gframe)
+        self._frame_q = queue.Queue(maxsize=8)
+        self._reader_stop = threading.Event()
+        threading.Thread(
+            target=self._reader_loop,
+            args=(self.paths, self.fps, self.start_frame, idx, local,
+                  self._frame_q, self._reader_stop,
+                  self.hw_device if self.hw_decode_var.get() else None),
+            daemon=True
+        ).start()
+
+    def _stop_reader(self):
+        if self._reader_stop is not None:
+            self._reader_stop.set()
+        self._reader_stop = None
+        self._frame_q = None
+
+    @staticmethod
+    def _queue_put(q, stop, item):
+        # Block while the queue is full (back-pressure), but give up promptly once stopped
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _reader_loop(self, paths, fps, start_frame, idx, local, q, stop, hw_device):
+        """Worker thread: decode frames sequentially from (idx, local), crossing clip boundaries."""
+        while idx < len(paths) and not stop.is_set():
+            frames = iter_clip_frames(paths[idx], local, float(fps[idx]), hw_device)
+            gframe = int(start_frame[idx]) + local
+            try:
+                for frame in frames:
+                    if not self._queue_put(q, stop, (gframe, frame)):
+                        return
+                    gframe += 1
+            finally:
+                frames.close()
+            # End of current file -> advance to next
+            idx += 1
+            local = 0
+        if not stop.is_set():
+            self._queue_put(q, stop, None)  # signal the very end
+
+    def _on_hw_decode_toggle(self):
+        if self.playing and self.paths:
+            self._start_reader(self.cur_global_frame + 1)  # cur_global_frame is on screen
+
     def _timer_tick(self):
-        """Runs periodically; if playing, read next frame and schedule based on fps and speed."""
+        """Runs periodically; if playing, show the next decoded frame and schedule based on fps and speed."""
         delay = 33  # default ~30 fps
-        if self.files and self.playing:
-            # Ensure capture points to correct clip/position
-            file_idx, local_frame = self._global_to_file_local(self.cur_global_frame)
-            self._open_capture_for_file(file_idx)
-            # If our cap position drifted, snap it (cheap check)
-            cap_pos = int(self.cap.get(cv2.CAP_PROP_POS_FRAMES) or 0)
-            if abs(cap_pos - local_frame) > 1:
-                self.cap.set(cv2.CAP_PROP_POS_FRAMES, float(local_frame))
-            ok, frame = self.cap.read()
-            if not ok:
-                # End of current file -> advance to next
-                if file_idx + 1 < len(self.files):
-                    self._open_capture_for_file(file_idx + 1)
-                    self.cur_global_frame = self.files[file_idx + 1]["start_frame"]
-                    ok, frame = self.cap.read()
+        if self.paths and self.playing and self._frame_q is not None:
+            try:
+                item = self._frame_q.get_nowait()
+            except queue.Empty:
+                # Decoder hasn't caught up yet; check again shortly
+                self.after(5, self._timer_tick)
+                return
+
+            if item is None:
+                # Reached the very end
+                if self.loop_var.get():
+                    self.seek_to(0)
                 else:
-                    # Reached the very end
-                    if self.loop_var.get():
-                        self.seek_to(0)
-                        ok, frame = self.cap.read()
-                    else:
-                        self.playing = False
-                        self.play_btn.config(text="Play")
-                        self.after(delay, self._timer_tick)
-                        return
+                    self.playing = False
+                    self.play_btn.config(text="Play")
+                    self._stop_reader()
+                self.after(delay, self._timer_tick)
+                return
 
-            if ok:
-                self._show_frame(frame)
-                self.cur_global_frame = clamp(self.cur_global_frame + 1, 0, self.total_frames - 1)
-                if not self.seeking:
-                    self.slider.set(self.cur_global_frame)
-                self.status_var.set(self._status_text())
+            gframe, frame = item
+            self._show_frame(frame)
+            file_idx, _ = self._global_to_file_local(gframe)
+            self.cur_global_frame = clamp(gframe, 0, self.total_frames - 1)  # frame on screen
+            if not self.seeking:
+                self.slider.set(self.cur_global_frame)
+            self.status_var.set(self._status_text())
 
             # Next delay according to current clip fps AND speed
-            fps = self.files[self.cur_file_idx]["fps"] if self.files else 30.0
+            fps = float(self.fps[file_idx])
             eff_fps = max(1.0, fps * max(0.01, float(self.play_speed)))
             delay = int(max(1, round(1000.0 / eff_fps)))
 
@@ -316,31 +552,36 @@ class FolderVideoPlayer(tk.Tk):
     # ---------- Display ----------
 
     def _show_frame(self, bgr):
-        # Convert to RGB and scale to fit width
-        rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+        # Convert to RGB (into a reused buffer) and scale to fit width
+        if self._rgb_buf is None or self._rgb_buf.shape != bgr.shape:
+            self._rgb_buf = np.empty_like(bgr)
+        rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
         h, w, _ = rgb.shape
         if w > self.max_display_width:
             scale = self.max_display_width / float(w)
-            new_size = (int(w * scale), int(h * scale))
-            rgb = cv2.resize(rgb, new_size, interpolation=cv2.INTER_AREA)
-        img = Image.fromarray(rgb)
-        self._tk_img = ImageTk.PhotoImage(img)  # keep a ref
-        self.video_label.configure(image=self._tk_img)
+            new_w, new_h = int(w * scale), int(h * scale)
+            if self._resize_buf is None or self._resize_buf.shape[:2] != (new_h, new_w):
+                self._resize_buf = np.empty((new_h, new_w, 3), dtype=np.uint8)
+            # INTER_LINEAR: visually the same as INTER_AREA for this mild downscale, 2-3x cheaper
+            rgb = cv2.resize(rgb, (new_w, new_h), dst=self._resize_buf, interpolation=cv2.INTER_LINEAR)
+        size = (rgb.shape[1], rgb.shape[0])
+        if self._tk_img is None or (self._tk_img.width(), self._tk_img.height()) != size:
+            self._tk_img = ImageTk.PhotoImage("RGB", size)  # keep a ref
+            self.video_label.configure(image=self._tk_img)
+        # Wrap the array without copying and paste into the existing Tk image
+        self._tk_img.paste(Image.frombuffer("RGB", size, rgb, "raw", "RGB", 0, 1))
 
     def _display_current_frame(self):
         # Read the current frame without advancing global frame
-        idx, local = self._global_to_file_local(self.cur_global_frame)
-        self._open_capture_for_file(idx)
-        self.cap.set(cv2.CAP_PROP_POS_FRAMES, float(local))
+        self._open_capture_for_global_frame(self.cur_global_frame)
         ok, frame = self.cap.read()
         if ok:
             # reading advanced by 1; keep global pointer consistent with what we show
+            self._expected_local_frame += 1
             self._show_frame(frame)
         else:
-            # Try a second time (some containers need a nudge)
-            ok2, frame2 = self.cap.read()
-            if ok2:
-                self._show_frame(frame2)
+            # Position is unknown now; force a seek next time
+            self._expected_local_frame = -1
 
     # ---------- Slider callbacks ----------
 
@@ -355,11 +596,11 @@ class FolderVideoPlayer(tk.Tk):
 
     def _on_slider_move(self, _val):
         # While dragging, just update the status text (cheap).
-        if self.seeking and self.files:
+        if self.seeking and self.paths:
             target = int(float(_val))
             file_idx, local = self._global_to_file_local(target)
             # Approximate time: start_time + local/fps
-            t = self.files[file_idx]["start_time"] + (local / max(1.0, self.files[file_idx]["fps"]))
+            t = self.start_time[file_idx] + (local / max(1.0, self.fps[file_idx]))
             self.status_var.set(self._status_text(frame=target, time_sec=t))
 
     # ---------- Status formatting ----------
@@ -370,13 +611,13 @@ class FolderVideoPlayer(tk.Tk):
         return f"{h:02d}:{m:02d}:{s:05.2f}" if h > 0 else f"{m:02d}:{s:05.2f}"
 
     def _status_text(self, frame=None, time_sec=None) -> str:
-        if not self.files:
+        if not self.paths:
             return ""
         if frame is None:
             frame = self.cur_global_frame
         if time_sec is None:
             i, local = self._global_to_file_local(frame)
-            time_sec = self.files[i]["start_time"] + local / max(1.0, self.files[i]["fps"])
+            time_sec = self.start_time[i] + local / max(1.0, self.fps[i])
         return (
             f"Frame {frame+1:,} / {self.total_frames:,}   |   "
             f"{self._fmt_time(time_sec)} / {self._fmt_time(self.total_seconds)}   |   "